@@ -182,6 +182,7 @@ from polars.io import (
     read_csv,
     read_csv_batched,
     read_database,
+    read_database_async,
     read_database_uri,
     read_delta,
     read_excel,
@@ -296,6 +297,7 @@ __all__ = [
     "read_csv",
     "read_csv_batched",
     "read_database",
+    "read_database_async",
     "read_database_uri",
     "read_delta",
     "read_excel",
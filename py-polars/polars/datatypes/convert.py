@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import contextlib
 import ctypes
 import functools
 import re
 import sys
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal as PyDecimal
+from math import ceil
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -51,10 +52,6 @@ from polars.datatypes import (
 from polars.dependencies import numpy as np
 from polars.dependencies import pyarrow as pa
 
-with contextlib.suppress(ImportError):  # Module not available when building docs
-    from polars.polars import dtype_str_repr as _dtype_str_repr
-
-
 OptionType = type(Optional[type])
 if sys.version_info >= (3, 10):
     from types import NoneType, UnionType
@@ -64,11 +61,18 @@ else:
     UnionType = type(Union[int, float])
 
 if TYPE_CHECKING:
-    from typing import Literal
+    from typing import Literal, Mapping
 
     from polars.type_aliases import PolarsDataType, PythonDataType, SchemaDict, TimeUnit
 
 
+_RE_PAREN_MOD = re.compile(r"\([\w,: ]+\)$")
+_RE_BRACKET_MOD = re.compile(r"\[[\w,\]\[: ]+]$")
+_RE_OF = re.compile(r"\WOF\W")
+_RE_NONWORD = re.compile(r"\W")
+_RE_DIGIT = re.compile(r"\d")
+_RE_SHORT_REPR = re.compile(r"^(\w+)(?:\[(.+)\])?$")
+
 PY_STR_TO_DTYPE: SchemaDict = {
     "float": Float64,
     "int": Int64,
@@ -86,42 +90,101 @@ PY_STR_TO_DTYPE: SchemaDict = {
     "NoneType": Null,
 }
 
+# typename markers used when inferring dtypes from database cursor descriptions
+_DB_ARRAY_ALIASES = ("ARRAY", "LIST", "[]")
+_DB_BINARY_TYPENAMES = frozenset(("BYTEA", "BYTES", "BLOB", "CLOB", "BINARY"))
+_DB_DATE_TYPENAMES = frozenset(("DATE", "DATE32", "DATE64"))
+_DB_DATETIME_PREFIXES = ("DATETIME", "TIMESTAMP")
+_DB_DURATION_TYPENAMES = frozenset(("INTERVAL", "TIMEDELTA"))
+_DB_INTEGER_PREFIXES = ("INT", "UINT", "UNSIGNED")
+_DB_INTEGER_SUFFIXES = ("INT", "SERIAL")
+_DB_STRING_MARKERS = ("VARCHAR", "STRING", "TEXT", "UNICODE")
+_DB_STRING_PREFIXES = ("STR", "CHAR", "NCHAR", "UTF")
+_DB_STRING_SUFFIXES = ("_UTF8", "_UTF16", "_UTF32")
+_DB_TIME_TYPENAMES = frozenset(("TIME", "TIME32", "TIME64"))
+_DB_TIMEUNIT_SUFFIXES = ("[S]", "[MS]", "[US]", "[NS]")
+_DB_TIMEZONE_MARKERS = ("TZ", "TIMEZONE")
+
+# common (unmodified) database typenames that resolve directly to a dtype,
+# allowing us to skip the more general inference heuristics below
+_DB_TYPENAME_TO_DTYPE: dict[str, PolarsDataType] = {
+    "BIGINT": Int64,
+    "BIGSERIAL": Int64,
+    "BINARY": Binary,
+    "BLOB": Binary,
+    "BOOL": Boolean,
+    "BOOLEAN": Boolean,
+    "BYTEA": Binary,
+    "BYTES": Binary,
+    "CHAR": String,
+    "CLOB": Binary,
+    "DATE": Date,
+    "DATE32": Date,
+    "DATE64": Date,
+    "DATETIME": Datetime("us"),
+    "DECIMAL": Decimal,
+    "DOUBLE": Float64,
+    "FLOAT": Float64,
+    "FLOAT4": Float32,
+    "FLOAT8": Float64,
+    "INT": Int64,
+    "INT2": Int16,
+    "INT4": Int32,
+    "INT8": Int64,
+    "INTEGER": Int64,
+    "INTERVAL": Duration,
+    "NCHAR": String,
+    "NUMERIC": Float64,
+    "NVARCHAR": String,
+    "REAL": Float64,
+    "SERIAL": Int32,
+    "SMALLINT": Int16,
+    "SMALLSERIAL": Int16,
+    "STRING": String,
+    "TEXT": String,
+    "TIME": Time,
+    "TIME32": Time,
+    "TIME64": Time,
+    "TIMESTAMP": Datetime("us"),
+    "TINYINT": Int8,
+    "UTF8": String,
+    "VARCHAR": String,
+}
+
+
+_PY_TYPE_TO_DTYPE: dict[Any, PolarsDataType] = {
+    float: Float64,
+    int: Int64,
+    str: String,
+    bool: Boolean,
+    datetime: Datetime("us"),
+    date: Date,
+    timedelta: Duration("us"),
+    time: Time,
+    list: List,
+    tuple: List,
+    PyDecimal: Decimal,
+    bytes: Binary,
+    object: Object,
+    NoneType: Null,
+}
+
 
-@functools.lru_cache(16)
+@functools.lru_cache(maxsize=256, typed=False)
 def _map_py_type_to_dtype(
     python_dtype: PythonDataType | type[object],
 ) -> PolarsDataType:
     """Convert Python data type to Polars data type."""
-    if python_dtype is float:
-        return Float64
-    if python_dtype is int:
-        return Int64
-    if python_dtype is str:
-        return String
-    if python_dtype is bool:
-        return Boolean
-    if issubclass(python_dtype, datetime):
-        # `datetime` is a subclass of `date`,
-        # so need to check `datetime` first
-        return Datetime("us")
-    if issubclass(python_dtype, date):
-        return Date
-    if python_dtype is timedelta:
-        return Duration("us")
-    if python_dtype is time:
-        return Time
-    if python_dtype is list:
-        return List
-    if python_dtype is tuple:
-        return List
-    if python_dtype is PyDecimal:
-        return Decimal
-    if python_dtype is bytes:
-        return Binary
-    if python_dtype is object:
-        return Object
-    if python_dtype is None.__class__:
-        return Null
+    if (dtype := _PY_TYPE_TO_DTYPE.get(python_dtype)) is not None:
+        return dtype
+
+    if isinstance(python_dtype, type):
+        if issubclass(python_dtype, datetime):
+            # `datetime` is a subclass of `date`,
+            # so need to check `datetime` first
+            return Datetime("us")
+        if issubclass(python_dtype, date):
+            return Date
 
     # cover generic typing aliases, such as 'list[str]'
     if hasattr(python_dtype, "__origin__") and hasattr(python_dtype, "__args__"):
@@ -139,24 +202,27 @@ def _map_py_type_to_dtype(
     raise TypeError(msg)
 
 
+# time unit for each digit of fractional-second precision (0-9)
+_PRECISION_TO_TIMEUNIT = ("ms", "ms", "ms", "ms", "us", "us", "us", "ns", "ns", "ns")
+_TIMEUNIT_ALIASES = {"s": "ms", "ms": "ms", "us": "us", "ns": "ns"}
+
+
+@functools.lru_cache(maxsize=256)
 def _timeunit_from_precision(precision: int | str | None) -> str | None:
     """Return `time_unit` from integer precision value."""
-    from math import ceil
-
     if not precision:
         return None
     elif isinstance(precision, str):
-        if precision.isdigit():
-            precision = int(precision)
-        elif (precision := precision.lower()) in ("s", "ms", "us", "ns"):
-            return "ms" if precision == "s" else precision
+        if not precision.isdigit():
+            return _TIMEUNIT_ALIASES.get(precision.lower())
+        precision = int(precision)
     try:
-        n = min(max(3, int(ceil(precision / 3)) * 3), 9)  # type: ignore[operator]
-        return {3: "ms", 6: "us", 9: "ns"}.get(n)
+        return _PRECISION_TO_TIMEUNIT[min(max(ceil(precision), 0), 9)]
     except TypeError:
         return None
 
 
+@functools.lru_cache(maxsize=512)
 def _infer_dtype_from_database_typename(
     value: str,
     *,
@@ -169,22 +235,27 @@ def _infer_dtype_from_database_typename(
     original_value = value
     value = value.upper().replace("TYPE", "")
 
-    # extract optional type modifier (eg: 'VARCHAR(64)' -> '64')
-    if re.search(r"\([\w,: ]+\)$", value):
-        modifier = value[value.find("(") + 1 : -1]
-        value = value.split("(")[0]
-    elif (
-        not value.startswith(("<", ">")) and re.search(r"\[[\w,\]\[: ]+]$", value)
-    ) or value.endswith(("[S]", "[MS]", "[US]", "[NS]")):
-        modifier = value[value.find("[") + 1 : -1]
-        value = value.split("[")[0]
-    else:
-        modifier = ""
+    # extract optional type modifier (eg: 'VARCHAR(64)' -> '64'); we only
+    # need to look for one if the value ends with a closing bracket
+    modifier = ""
+    if value.endswith(")"):
+        if _RE_PAREN_MOD.search(value):
+            idx = value.find("(")
+            modifier, value = value[idx + 1 : -1], value[:idx]
+    elif value.endswith("]") and (
+        (not value.startswith(("<", ">")) and _RE_BRACKET_MOD.search(value))
+        or value.endswith(_DB_TIMEUNIT_SUFFIXES)
+    ):
+        idx = value.find("[")
+        modifier, value = value[idx + 1 : -1], value[:idx]
+
+    # fast-path for common typenames that don't require further inspection
+    if not modifier and (dtype := _DB_TYPENAME_TO_DTYPE.get(value)) is not None:
+        return dtype
 
     # array dtypes
-    array_aliases = ("ARRAY", "LIST", "[]")
-    if value.endswith(array_aliases) or value.startswith(array_aliases):
-        for a in array_aliases:
+    if value.endswith(_DB_ARRAY_ALIASES) or value.startswith(_DB_ARRAY_ALIASES):
+        for a in _DB_ARRAY_ALIASES:
             value = value.replace(a, "", 1) if value else ""
 
         nested: PolarsDataType | None = None
@@ -197,7 +268,7 @@ def _infer_dtype_from_database_typename(
             if inner_value := _infer_dtype_from_database_typename(
                 value[1:-1]
                 if (value[0], value[-1]) == ("<", ">")
-                else re.sub(r"\W", "", re.sub(r"\WOF\W", "", value)),
+                else _RE_NONWORD.sub("", _RE_OF.sub("", value)),
                 raise_unmatched=False,
             ):
                 nested = inner_value
@@ -220,8 +291,8 @@ def _infer_dtype_from_database_typename(
 
     # integer dtypes
     elif ("INTERVAL" not in value) and (
-        value.startswith(("INT", "UINT", "UNSIGNED"))
-        or value.endswith(("INT", "SERIAL"))
+        value.startswith(_DB_INTEGER_PREFIXES)
+        or value.endswith(_DB_INTEGER_SUFFIXES)
         or ("INTEGER" in value)
         or value == "ROWID"
     ):
@@ -259,14 +330,14 @@ def _infer_dtype_from_database_typename(
 
     # string dtypes
     elif (
-        any(tp in value for tp in ("VARCHAR", "STRING", "TEXT", "UNICODE"))
-        or value.startswith(("STR", "CHAR", "NCHAR", "UTF"))
-        or value.endswith(("_UTF8", "_UTF16", "_UTF32"))
+        any(tp in value for tp in _DB_STRING_MARKERS)
+        or value.startswith(_DB_STRING_PREFIXES)
+        or value.endswith(_DB_STRING_SUFFIXES)
     ):
         dtype = String
 
     # binary dtypes
-    elif value in ("BYTEA", "BYTES", "BLOB", "CLOB", "BINARY"):
+    elif value in _DB_BINARY_TYPENAMES:
         dtype = Binary
 
     # boolean dtypes
@@ -274,20 +345,20 @@ def _infer_dtype_from_database_typename(
         dtype = Boolean
 
     # temporal dtypes
-    elif value.startswith(("DATETIME", "TIMESTAMP")) and not (value.endswith("[D]")):
-        if any((tz in value.replace(" ", "")) for tz in ("TZ", "TIMEZONE")):
+    elif value.startswith(_DB_DATETIME_PREFIXES) and not (value.endswith("[D]")):
+        if any((tz in value.replace(" ", "")) for tz in _DB_TIMEZONE_MARKERS):
             if "WITHOUT" not in value:
                 return None  # there's a timezone, but we don't know what it is
         unit = _timeunit_from_precision(modifier) if modifier else "us"
         dtype = Datetime(time_unit=(unit or "us"))  # type: ignore[arg-type]
 
-    elif re.sub(r"\d", "", value) in ("INTERVAL", "TIMEDELTA"):
+    elif _RE_DIGIT.sub("", value) in _DB_DURATION_TYPENAMES:
         dtype = Duration
 
-    elif value in ("DATE", "DATE32", "DATE64"):
+    elif value in _DB_DATE_TYPENAMES:
         dtype = Date
 
-    elif value in ("TIME", "TIME32", "TIME64"):
+    elif value in _DB_TIME_TYPENAMES:
         dtype = Time
 
     if not dtype and raise_unmatched:
@@ -297,37 +368,51 @@ def _infer_dtype_from_database_typename(
     return dtype
 
 
-@functools.lru_cache(8)
+_SIGNED_INTEGER_DTYPE_FROM_NBITS: dict[int, PolarsDataType] = {
+    8: Int8,
+    16: Int16,
+    32: Int32,
+    64: Int64,
+}
+_UNSIGNED_INTEGER_DTYPE_FROM_NBITS: dict[int, PolarsDataType] = {
+    8: UInt8,
+    16: UInt16,
+    32: UInt32,
+    64: UInt64,
+}
+
+
 def _integer_dtype_from_nbits(
     bits: int,
     *,
     unsigned: bool,
     default: PolarsDataType | None = None,
 ) -> PolarsDataType | None:
-    dtype = {
-        (8, False): Int8,
-        (8, True): UInt8,
-        (16, False): Int16,
-        (16, True): UInt16,
-        (32, False): Int32,
-        (32, True): UInt32,
-        (64, False): Int64,
-        (64, True): UInt64,
-    }.get((bits, unsigned), None)
-
-    if dtype is None and default is not None:
-        return default
-    return dtype
+    dtypes = (
+        _UNSIGNED_INTEGER_DTYPE_FROM_NBITS
+        if unsigned
+        else _SIGNED_INTEGER_DTYPE_FROM_NBITS
+    )
+    return dtypes.get(bits, default)
+
+
+# memoised "is this type a polars dtype?" results, keyed on the type of the input
+_IS_POLARS_DTYPE_CACHE: dict[type, bool] = {}
+_IS_POLARS_DTYPE_CACHE_MAXSIZE = 512
 
 
 def is_polars_dtype(dtype: Any, *, include_unknown: bool = False) -> bool:
     """Indicate whether the given input is a Polars dtype, or dtype specialization."""
+    tp = type(dtype)
+    if (is_dtype := _IS_POLARS_DTYPE_CACHE.get(tp)) is None:
+        is_dtype = issubclass(tp, (DataType, DataTypeClass))
+        if len(_IS_POLARS_DTYPE_CACHE) < _IS_POLARS_DTYPE_CACHE_MAXSIZE:
+            _IS_POLARS_DTYPE_CACHE[tp] = is_dtype
+    if not is_dtype:
+        return False
     try:
-        if dtype == Unknown:
-            # does not represent a realizable dtype, so ignore by default
-            return include_unknown
-        else:
-            return isinstance(dtype, (DataType, DataTypeClass))
+        # does not represent a realizable dtype, so ignore by default
+        return include_unknown if dtype == Unknown else True
     except TypeError:
         return False
 
@@ -367,106 +452,142 @@ def unpack_dtypes(
     """  # noqa: W505
     if not dtypes:
         return set()
-    elif len(dtypes) == 1 and isinstance(dtypes[0], Collection):
-        dtypes = dtypes[0]
+
+    # walk nested dtypes with an explicit stack (avoids recursive calls); a
+    # single collection of dtypes is unpacked (checking common concrete types
+    # first, with the Collection fallback covering dict views, etc)
+    first: Any = dtypes[0]
+    if len(dtypes) == 1 and (
+        isinstance(first, (list, tuple, set, frozenset))
+        or (isinstance(first, Collection) and not isinstance(first, str))
+    ):
+        stack: list[Any] = list(first)
+    else:
+        stack = list(dtypes)
 
     unpacked: set[PolarsDataType] = set()
-    for tp in dtypes:
+    while stack:
+        tp = stack.pop()
         if isinstance(tp, (List, Array)):
             if include_compound:
                 unpacked.add(tp)
-            unpacked.update(unpack_dtypes(tp.inner, include_compound=include_compound))
+            stack.append(tp.inner)
         elif isinstance(tp, Struct):
             if include_compound:
                 unpacked.add(tp)
-            unpacked.update(unpack_dtypes(tp.fields, include_compound=include_compound))  # type: ignore[arg-type]
+            stack.extend(tp.fields)
         elif isinstance(tp, Field):
-            unpacked.update(unpack_dtypes(tp.dtype, include_compound=include_compound))
+            stack.append(tp.dtype)
         elif tp is not None and is_polars_dtype(tp):
             unpacked.add(tp)
     return unpacked
 
 
-class _DataTypeMappings:
-    @property
-    @functools.lru_cache  # noqa: B019
-    def DTYPE_TO_FFINAME(self) -> dict[PolarsDataType, str]:
-        return {
-            Int8: "i8",
-            Int16: "i16",
-            Int32: "i32",
-            Int64: "i64",
-            UInt8: "u8",
-            UInt16: "u16",
-            UInt32: "u32",
-            UInt64: "u64",
-            Float32: "f32",
-            Float64: "f64",
-            Decimal: "decimal",
-            Boolean: "bool",
-            String: "str",
-            List: "list",
-            Date: "date",
-            Datetime: "datetime",
-            Duration: "duration",
-            Time: "time",
-            Object: "object",
-            Categorical: "categorical",
-            Struct: "struct",
-            Binary: "binary",
-        }
+_DTYPE_TO_FFINAME: Mapping[PolarsDataType, str] = MappingProxyType(
+    {
+        Int8: "i8",
+        Int16: "i16",
+        Int32: "i32",
+        Int64: "i64",
+        UInt8: "u8",
+        UInt16: "u16",
+        UInt32: "u32",
+        UInt64: "u64",
+        Float32: "f32",
+        Float64: "f64",
+        Decimal: "decimal",
+        Boolean: "bool",
+        String: "str",
+        List: "list",
+        Date: "date",
+        Datetime: "datetime",
+        Duration: "duration",
+        Time: "time",
+        Object: "object",
+        Categorical: "categorical",
+        Struct: "struct",
+        Binary: "binary",
+    }
+)
 
-    @property
-    @functools.lru_cache  # noqa: B019
-    def DTYPE_TO_CTYPE(self) -> dict[PolarsDataType, Any]:
-        return {
-            UInt8: ctypes.c_uint8,
-            UInt16: ctypes.c_uint16,
-            UInt32: ctypes.c_uint32,
-            UInt64: ctypes.c_uint64,
-            Int8: ctypes.c_int8,
-            Int16: ctypes.c_int16,
-            Int32: ctypes.c_int32,
-            Int64: ctypes.c_int64,
-            Float32: ctypes.c_float,
-            Float64: ctypes.c_double,
-            Datetime: ctypes.c_int64,
-            Duration: ctypes.c_int64,
-            Date: ctypes.c_int32,
-            Time: ctypes.c_int64,
-        }
+_DTYPE_TO_CTYPE: Mapping[PolarsDataType, Any] = MappingProxyType(
+    {
+        UInt8: ctypes.c_uint8,
+        UInt16: ctypes.c_uint16,
+        UInt32: ctypes.c_uint32,
+        UInt64: ctypes.c_uint64,
+        Int8: ctypes.c_int8,
+        Int16: ctypes.c_int16,
+        Int32: ctypes.c_int32,
+        Int64: ctypes.c_int64,
+        Float32: ctypes.c_float,
+        Float64: ctypes.c_double,
+        Datetime: ctypes.c_int64,
+        Duration: ctypes.c_int64,
+        Date: ctypes.c_int32,
+        Time: ctypes.c_int64,
+    }
+)
 
-    @property
-    @functools.lru_cache  # noqa: B019
-    def DTYPE_TO_PY_TYPE(self) -> dict[PolarsDataType, PythonDataType]:
-        return {
-            Float64: float,
-            Float32: float,
-            Int64: int,
-            Int32: int,
-            Int16: int,
-            Int8: int,
-            String: str,
-            UInt8: int,
-            UInt16: int,
-            UInt32: int,
-            UInt64: int,
-            Decimal: PyDecimal,
-            Boolean: bool,
-            Duration: timedelta,
-            Datetime: datetime,
-            Date: date,
-            Time: time,
-            Binary: bytes,
-            List: list,
-            Array: list,
-            Null: None.__class__,
-        }
+_DTYPE_TO_PY_TYPE: Mapping[PolarsDataType, PythonDataType] = MappingProxyType(
+    {
+        Float64: float,
+        Float32: float,
+        Int64: int,
+        Int32: int,
+        Int16: int,
+        Int8: int,
+        String: str,
+        UInt8: int,
+        UInt16: int,
+        UInt32: int,
+        UInt64: int,
+        Decimal: PyDecimal,
+        Boolean: bool,
+        Duration: timedelta,
+        Datetime: datetime,
+        Date: date,
+        Time: time,
+        Binary: bytes,
+        List: list,
+        Array: list,
+        Null: None.__class__,
+    }
+)
 
-    @property
-    @functools.lru_cache  # noqa: B019
-    def NUMPY_KIND_AND_ITEMSIZE_TO_DTYPE(self) -> dict[tuple[str, int], PolarsDataType]:
-        return {
+# dtype short repr (as returned by `dtype_str_repr`, without any parameters)
+_REPR_TO_DTYPE: Mapping[str, PolarsDataType] = MappingProxyType(
+    {
+        "i8": Int8,
+        "i16": Int16,
+        "i32": Int32,
+        "i64": Int64,
+        "u8": UInt8,
+        "u16": UInt16,
+        "u32": UInt32,
+        "u64": UInt64,
+        "f32": Float32,
+        "f64": Float64,
+        "bool": Boolean,
+        "str": String,
+        "binary": Binary,
+        "date": Date,
+        "datetime": Datetime,
+        "duration": Duration,
+        "time": Time,
+        "list": List,
+        "array": Array,
+        "struct": Struct,
+        "decimal": Decimal,
+        "cat": Categorical,
+        "object": Object,
+        "null": Null,
+    }
+)
+
+_NUMPY_KIND_AND_ITEMSIZE_TO_DTYPE: Mapping[tuple[str, int], PolarsDataType] = (
+    MappingProxyType(
+        {
             # (np.dtype().kind, np.dtype().itemsize)
             ("b", 1): Boolean,
             ("i", 1): Int8,
@@ -482,11 +603,15 @@ class _DataTypeMappings:
             ("m", 8): Duration,
             ("M", 8): Datetime,
         }
+    )
+)
+
 
-    @property
-    @functools.lru_cache  # noqa: B019
-    def PY_TYPE_TO_ARROW_TYPE(self) -> dict[PythonDataType, pa.lib.DataType]:
-        return {
+@functools.lru_cache(maxsize=1)
+def _py_type_to_arrow_type() -> Mapping[PythonDataType, pa.lib.DataType]:
+    # built on first use, so that we don't trigger the (lazy) pyarrow import
+    return MappingProxyType(
+        {
             float: pa.float64(),
             int: pa.int64(),
             str: pa.large_utf8(),
@@ -497,32 +622,16 @@ class _DataTypeMappings:
             timedelta: pa.duration("us"),
             None.__class__: pa.null(),
         }
-
-    @property
-    @functools.lru_cache  # noqa: B019
-    def REPR_TO_DTYPE(self) -> dict[str, PolarsDataType]:
-        def _dtype_str_repr_safe(o: Any) -> PolarsDataType | None:
-            try:
-                return _dtype_str_repr(o.base_type()).split("[")[0]
-            except TypeError:
-                return None
-
-        return {
-            _dtype_str_repr_safe(obj): obj  # type: ignore[misc]
-            for obj in globals().values()
-            if is_polars_dtype(obj) and _dtype_str_repr_safe(obj) is not None
-        }
-
-
-# Initialize once (poor man's singleton :)
-DataTypeMappings = _DataTypeMappings()
+    )
 
 
 def dtype_to_ctype(dtype: PolarsDataType) -> Any:
     """Convert a Polars dtype to a ctype."""
+    if (ctype := _DTYPE_TO_CTYPE.get(dtype)) is not None:
+        return ctype
     try:
         dtype = dtype.base_type()
-        return DataTypeMappings.DTYPE_TO_CTYPE[dtype]
+        return _DTYPE_TO_CTYPE[dtype]
     except KeyError:  # pragma: no cover
         msg = f"conversion of polars data type {dtype!r} to C-type not implemented"
         raise NotImplementedError(msg) from None
@@ -530,9 +639,11 @@ def dtype_to_ctype(dtype: PolarsDataType) -> Any:
 
 def dtype_to_ffiname(dtype: PolarsDataType) -> str:
     """Return FFI function name associated with the given Polars dtype."""
+    if (ffiname := _DTYPE_TO_FFINAME.get(dtype)) is not None:
+        return ffiname
     try:
         dtype = dtype.base_type()
-        return DataTypeMappings.DTYPE_TO_FFINAME[dtype]
+        return _DTYPE_TO_FFINAME[dtype]
     except KeyError:  # pragma: no cover
         msg = f"conversion of polars data type {dtype!r} to FFI not implemented"
         raise NotImplementedError(msg) from None
@@ -540,9 +651,11 @@ def dtype_to_ffiname(dtype: PolarsDataType) -> str:
 
 def dtype_to_py_type(dtype: PolarsDataType) -> PythonDataType:
     """Convert a Polars dtype to a Python dtype."""
+    if (py_type := _DTYPE_TO_PY_TYPE.get(dtype)) is not None:
+        return py_type
     try:
         dtype = dtype.base_type()
-        return DataTypeMappings.DTYPE_TO_PY_TYPE[dtype]
+        return _DTYPE_TO_PY_TYPE[dtype]
     except KeyError:  # pragma: no cover
         msg = f"conversion of polars data type {dtype!r} to Python type not implemented"
         raise NotImplementedError(msg) from None
@@ -566,16 +679,24 @@ def py_type_to_dtype(
     """Convert a Python dtype (or type annotation) to a Polars dtype."""
     if isinstance(data_type, ForwardRef):
         annotation = data_type.__forward_arg__
-        data_type = (
-            PY_STR_TO_DTYPE.get(
-                re.sub(r"(^None \|)|(\| None$)", "", annotation).strip(), data_type
-            )
-            if isinstance(annotation, str)  # type: ignore[redundant-expr]
-            else annotation
-        )
+        if isinstance(annotation, str):
+            # strip optional-type markers (eg: 'None | str' -> 'str')
+            if annotation.startswith("None |"):
+                annotation = annotation[6:]
+            if annotation.endswith("| None"):
+                annotation = annotation[:-6]
+            data_type = PY_STR_TO_DTYPE.get(annotation.strip(), data_type)
+        else:
+            data_type = annotation
     elif type(data_type).__name__ == "InitVar":
         data_type = data_type.type
 
+    # fast-path for the common case of a plain Python type (eg: int, str)
+    if isinstance(data_type, type) and (
+        (dtype := _PY_TYPE_TO_DTYPE.get(data_type)) is not None
+    ):
+        return dtype
+
     if is_polars_dtype(data_type):
         return data_type
 
@@ -587,10 +708,12 @@ def py_type_to_dtype(
             data_type = possible_types[0]
 
     elif allow_strings and isinstance(data_type, str):
-        data_type = DataTypeMappings.REPR_TO_DTYPE.get(
-            re.sub(r"^(?:dataclasses\.)?InitVar\[(.+)\]$", r"\1", data_type),
-            data_type,
-        )
+        repr_key = data_type
+        if repr_key.startswith(("InitVar[", "dataclasses.InitVar[")) and (
+            repr_key.endswith("]")
+        ):
+            repr_key = repr_key[repr_key.index("[") + 1 : -1]
+        data_type = _REPR_TO_DTYPE.get(repr_key, data_type)
         if is_polars_dtype(data_type):
             return data_type
     try:
@@ -605,22 +728,23 @@ def py_type_to_dtype(
 def py_type_to_arrow_type(dtype: PythonDataType) -> pa.lib.DataType:
     """Convert a Python dtype to an Arrow dtype."""
     try:
-        return DataTypeMappings.PY_TYPE_TO_ARROW_TYPE[dtype]
+        return _py_type_to_arrow_type()[dtype]
     except KeyError:  # pragma: no cover
         msg = f"cannot parse Python data type {dtype!r} into Arrow data type"
         raise ValueError(msg) from None
 
 
+@functools.lru_cache(maxsize=256)
 def dtype_short_repr_to_dtype(dtype_string: str | None) -> PolarsDataType | None:
     """Map a PolarsDataType short repr (eg: 'i64', 'list[str]') back into a dtype."""
     if dtype_string is None:
         return None
-    m = re.match(r"^(\w+)(?:\[(.+)\])?$", dtype_string)
+    m = _RE_SHORT_REPR.match(dtype_string)
     if m is None:
         return None
 
     dtype_base, subtype = m.groups()
-    dtype = DataTypeMappings.REPR_TO_DTYPE.get(dtype_base)
+    dtype = _REPR_TO_DTYPE.get(dtype_base)
     if dtype and subtype:
         # TODO: further-improve handling for nested types (such as List,Struct)
         try:
@@ -636,27 +760,32 @@ def dtype_short_repr_to_dtype(dtype_string: str | None) -> PolarsDataType | None
     return dtype
 
 
+@functools.lru_cache(maxsize=64)
+def _numpy_char_code_kind_and_itemsize(dtype_char: str) -> tuple[str, int]:
+    # avoids constructing a new numpy dtype on every lookup of the same char code
+    dtype = np.dtype(dtype_char)
+    return dtype.kind, dtype.itemsize
+
+
 def supported_numpy_char_code(dtype_char: str) -> bool:
     """Check if the input can be mapped to a Polars dtype."""
-    dtype = np.dtype(dtype_char)
     return (
-        dtype.kind,
-        dtype.itemsize,
-    ) in DataTypeMappings.NUMPY_KIND_AND_ITEMSIZE_TO_DTYPE
+        _numpy_char_code_kind_and_itemsize(dtype_char)
+        in _NUMPY_KIND_AND_ITEMSIZE_TO_DTYPE
+    )
 
 
 def numpy_char_code_to_dtype(dtype_char: str) -> PolarsDataType:
     """Convert a numpy character dtype to a Polars dtype."""
-    dtype = np.dtype(dtype_char)
-    if dtype.kind == "U":
+    kind, itemsize = _numpy_char_code_kind_and_itemsize(dtype_char)
+    if kind == "U":
         return String
-    elif dtype.kind == "S":
+    elif kind == "S":
         return Binary
     try:
-        return DataTypeMappings.NUMPY_KIND_AND_ITEMSIZE_TO_DTYPE[
-            (dtype.kind, dtype.itemsize)
-        ]
+        return _NUMPY_KIND_AND_ITEMSIZE_TO_DTYPE[(kind, itemsize)]
     except KeyError:  # pragma: no cover
+        dtype = np.dtype(dtype_char)
         msg = f"cannot parse numpy data type {dtype!r} into Polars data type"
         raise ValueError(msg) from None
 
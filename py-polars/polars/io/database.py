@@ -3,9 +3,23 @@ from __future__ import annotations
 import re
 import sys
 from contextlib import suppress
+from functools import lru_cache, partial
 from importlib import import_module
 from inspect import Parameter, isclass, signature
-from typing import TYPE_CHECKING, Any, Iterable, Literal, Sequence, TypedDict, overload
+from queue import Full, Queue
+from threading import Event, Thread
+from types import SimpleNamespace
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    Iterator,
+    Literal,
+    Sequence,
+    TypedDict,
+    TypeVar,
+    overload,
+)
 
 from polars._utils.deprecation import issue_deprecation_warning
 from polars.convert import from_arrow
@@ -13,19 +27,31 @@ from polars.datatypes import (
     INTEGER_DTYPES,
     N_INFER_DEFAULT,
     UNSIGNED_INTEGER_DTYPES,
+    Boolean,
     Decimal,
     Float32,
     Float64,
+    Int8,
+    Int16,
+    Int32,
+    Int64,
+    String,
+    UInt8,
+    UInt16,
+    UInt32,
+    UInt64,
 )
 from polars.datatypes.convert import (
     _infer_dtype_from_database_typename,
     _integer_dtype_from_nbits,
     _map_py_type_to_dtype,
 )
+from polars.dependencies import _PYARROW_AVAILABLE
 from polars.exceptions import InvalidOperationError, UnsuitableSQLError
 
 if TYPE_CHECKING:
     from types import TracebackType
+    from typing import Callable, Mapping
 
     import pyarrow as pa
 
@@ -47,6 +73,8 @@ if TYPE_CHECKING:
     except ImportError:
         Selectable: TypeAlias = Any  # type: ignore[no-redef]
 
+T = TypeVar("T")
+
 
 class _ArrowDriverProperties_(TypedDict):
     # name of the method that fetches all arrow data; tuple form
@@ -106,19 +134,203 @@ _ARROW_DRIVER_REGISTRY_: dict[str, _ArrowDriverProperties_] = {
     },
 }
 
-_INVALID_QUERY_TYPES = {
-    "ALTER",
-    "ANALYZE",
-    "CREATE",
-    "DELETE",
-    "DROP",
-    "INSERT",
-    "REPLACE",
-    "UPDATE",
-    "UPSERT",
-    "USE",
-    "VACUUM",
+# driver name patterns, compiled once (most are literal names, matched directly)
+_ARROW_DRIVER_PATTERNS_: list[tuple[re.Pattern[str], _ArrowDriverProperties_]] = [
+    (re.compile(f"^{driver}$"), driver_properties)
+    for driver, driver_properties in _ARROW_DRIVER_REGISTRY_.items()
+]
+
+# leading statement keywords (after any block comments) that are not 'read' queries
+_RE_INVALID_QUERY_TYPE = re.compile(
+    r"^\s*(?:/\*.*?\*/\s*)*"
+    r"(ALTER|ANALYZE|CREATE|DELETE|DROP|INSERT|REPLACE|UPDATE|UPSERT|USE|VACUUM)\b",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# sqlalchemy engine drivers where we use the raw connection's cursor (for
+# arrow integration); maps to the native driver name and cursor accessor
+_SQLALCHEMY_RAW_CURSORS: dict[str, tuple[str, Callable[[Any], Any]]] = {
+    "databricks-sql-python": ("databricks", lambda raw_conn: raw_conn.cursor()),
+    "duckdb_engine": ("duckdb", lambda raw_conn: raw_conn.driver_connection.c),
+}
+
+# replacement for "user:pass" credentials embedded in a connection URI
+_MASKED_URI_CREDENTIALS = "://***:***@"
+
+# map ADBC uri prefix to driver module suffix (when not 1:1), the
+# drivers that need the prefix stripped, and the imported modules
+_ADBC_MODULE_SUFFIXES = {"postgres": "postgresql"}
+_RE_ADBC_DRIVER_PREFIX = {
+    driver_name: re.compile(f"^{driver_name}:/{{,3}}")
+    for driver_name in ("sqlite", "snowflake")
 }
+_ADBC_DRIVER_MODULES: dict[str, Any] = {}
+
+# error messages indicating that a driver/connection can't return arrow data
+# (note: matched on message, as generic DBAPI2 errors such as 'NotSupportedError'
+# are also raised for other reasons, eg: unsupported result types)
+_ARROW_UNSUPPORTED_MESSAGES = (
+    "does not support Apache Arrow",
+    "Apache Arrow format is not supported",
+)
+
+# ODBC connection strings are identified by a "Driver={...}" attribute
+_RE_ODBC_DRIVER = re.compile(r"\bdriver\s*=\s*{[^}]+?}", re.IGNORECASE)
+
+# row prefetch size requested from DBAPI2 drivers when fetching a full resultset
+_FETCHALL_ARRAYSIZE = 10_000
+
+# cursor 'execute' method parameters (and whether any can be passed by keyword),
+# keyed on (cursor type, method name)
+_EXECUTE_PARAMS_CACHE: dict[tuple[type, str], tuple[Mapping[str, Parameter], bool]] = {}
+_KEYWORD_PARAMETER_KINDS = (Parameter.KEYWORD_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+
+
+def _execute_parameters(
+    cursor: Any, cursor_execute: Callable[..., Any]
+) -> tuple[Mapping[str, Parameter], bool]:
+    """Return the (cached) signature parameters of the given cursor 'execute' method."""
+    key = (type(cursor), getattr(cursor_execute, "__name__", ""))
+    if (execute_params := _EXECUTE_PARAMS_CACHE.get(key)) is None:
+        params: Mapping[str, Parameter]
+        try:
+            params = signature(cursor_execute).parameters
+        except ValueError:
+            params = {}
+        accepts_keywords = any(
+            p.kind in _KEYWORD_PARAMETER_KINDS for p in params.values()
+        )
+        execute_params = _EXECUTE_PARAMS_CACHE[key] = (params, accepts_keywords)
+    return execute_params
+
+
+@lru_cache(maxsize=1)
+def _sqlalchemy() -> SimpleNamespace:
+    """Import (once) the sqlalchemy objects used when executing queries."""
+    from sqlalchemy.orm import Session
+    from sqlalchemy.sql import text
+
+    return SimpleNamespace(Session=Session, text=text)
+
+
+def _arrow_driver_properties(driver_name: str) -> _ArrowDriverProperties_ | None:
+    """Return the arrow-fetch properties registered for the given driver (if any)."""
+    if (driver_properties := _ARROW_DRIVER_REGISTRY_.get(driver_name)) is not None:
+        return driver_properties
+    for driver_pattern, driver_properties in _ARROW_DRIVER_PATTERNS_:
+        if driver_pattern.match(driver_name):
+            return driver_properties
+    return None
+
+
+def _check_read_query(query: str) -> None:
+    """Raise an error if the query is (recognisably) not a 'read' query."""
+    if q := _RE_INVALID_QUERY_TYPE.match(query):
+        msg = f"{q.group(1).upper()} statements are not valid 'read' queries"
+        raise UnsuitableSQLError(msg)
+
+
+def _driver_threadsafety(obj: Any) -> int:
+    """Return the DBAPI2 'threadsafety' level declared by the object's driver module."""
+    # note: the level is declared at the top-level of the DBAPI2 module, which
+    # may be a parent of the module defining the object (eg: snowflake.connector)
+    module_path = type(obj).__module__.split(".")
+    while module_path:
+        module = sys.modules.get(".".join(module_path))
+        if isinstance(level := getattr(module, "threadsafety", None), int):
+            return level
+        module_path.pop()
+    return 0
+
+
+def _prefetch_iter(source: Iterable[T], ahead: int = 1) -> Iterator[T]:
+    """
+    Iterate over `source` from a background thread, staying `ahead` items ahead.
+
+    Items (or any exception raised by `source`) are handed over through a bounded
+    queue; the producer thread is stopped and joined when the iterator is closed.
+    """
+    handoff: Queue[tuple[Any, BaseException | None, bool]] = Queue(maxsize=ahead)
+    stop = Event()
+
+    def put(item: Any, err: BaseException | None = None, *, done: bool = False) -> bool:
+        while not stop.is_set():
+            try:
+                handoff.put((item, err, done), timeout=0.1)
+            except Full:
+                continue
+            return True
+        return False
+
+    def produce() -> None:
+        try:
+            for item in source:
+                if not put(item):
+                    return
+        except BaseException as err:
+            put(None, err, done=True)
+        else:
+            put(None, done=True)
+
+    producer = Thread(target=produce, name="polars-db-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, err, done = handoff.get()
+            if err is not None:
+                raise err
+            if done:
+                return
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
+def _coalesce_batches(
+    batches: Iterable[pa.RecordBatch | pa.Table], batch_size: int
+) -> Iterator[pa.RecordBatch | pa.Table | list[pa.RecordBatch | pa.Table]]:
+    """Group consecutive Arrow batches until they hold at least `batch_size` rows."""
+    pending: list[pa.RecordBatch | pa.Table] = []
+    n_rows = 0
+    for batch in batches:
+        pending.append(batch)
+        n_rows += batch.num_rows
+        if n_rows >= batch_size:
+            yield pending[0] if len(pending) == 1 else pending
+            pending, n_rows = [], 0
+    if pending:
+        yield pending[0] if len(pending) == 1 else pending
+
+
+@lru_cache(maxsize=1)
+def _arrow_primitive_types() -> dict[PolarsDataType, pa.DataType]:
+    """Map numeric/boolean/string polars dtypes to the equivalent arrow types."""
+    import pyarrow as pa
+
+    return {
+        Boolean: pa.bool_(),
+        Float32: pa.float32(),
+        Float64: pa.float64(),
+        Int8: pa.int8(),
+        Int16: pa.int16(),
+        Int32: pa.int32(),
+        Int64: pa.int64(),
+        String: pa.large_string(),
+        UInt8: pa.uint8(),
+        UInt16: pa.uint16(),
+        UInt32: pa.uint32(),
+        UInt64: pa.uint64(),
+    }
+
+
+def _to_arrow_array(values: Sequence[Any], dtype: PolarsDataType) -> pa.Array:
+    """Convert a column of python values to arrow, as the given dtype if possible."""
+    import pyarrow as pa
+
+    # note: values that don't fit the (known) arrow type raise; the caller
+    # then falls back to row-wise init, rather than inferring a different type
+    return pa.array(values, type=_arrow_primitive_types().get(dtype))
 
 
 class ODBCCursorProxy:
@@ -190,6 +402,9 @@ class ConnectionExecutor:
         self.cursor = self._normalise_cursor(connection)
         self.result: Any = None
 
+        # resolved after normalising the cursor, which may refine the driver name
+        self._arrow_props = _arrow_driver_properties(self.driver_name)
+
     def __enter__(self) -> Self:
         return self
 
@@ -236,27 +451,34 @@ class ConnectionExecutor:
                     yield arrow
 
     @staticmethod
-    def _fetchall_rows(result: Cursor) -> Iterable[Sequence[Any]]:
+    def _set_arraysize(result: Cursor, size: int, *, grow_only: bool) -> None:
+        """Size the driver's row prefetch buffer (if it exposes `arraysize`)."""
+        # note: drivers such as oracledb/psycopg use 'arraysize' to determine
+        # how many rows to fetch per network round-trip
+        current = getattr(result, "arraysize", None)
+        if isinstance(current, int) and (current < size or not grow_only):
+            with suppress(AttributeError, TypeError, ValueError):
+                result.arraysize = size  # type: ignore[attr-defined]
+
+    def _fetchall_rows(self, result: Cursor) -> Sequence[Sequence[Any]]:
         """Fetch row data in a single call, returning the complete result set."""
-        rows = result.fetchall()
-        return (
-            [tuple(row) for row in rows]
-            if rows and not isinstance(rows[0], (list, tuple))
-            else rows
-        )
+        if self.can_close_cursor:
+            # only resize cursors we created (never modify user-supplied state)
+            self._set_arraysize(result, _FETCHALL_ARRAYSIZE, grow_only=True)
+        return result.fetchall()
 
     def _fetchmany_rows(
-        self, result: Cursor, batch_size: int | None
-    ) -> Iterable[Sequence[Any]]:
+        self, result: Cursor, batch_size: int | None, *, owned_cursor: bool
+    ) -> Iterable[Sequence[Sequence[Any]]]:
         """Fetch row data incrementally, yielding over the complete result set."""
+        if batch_size and owned_cursor:
+            # only resize cursors we created (never modify user-supplied state)
+            self._set_arraysize(result, batch_size, grow_only=False)
         while True:
             rows = result.fetchmany(batch_size)
             if not rows:
                 break
-            elif isinstance(rows[0], (list, tuple)):
-                yield rows
-            else:
-                yield [tuple(row) for row in rows]
+            yield rows
 
     def _from_arrow(
         self,
@@ -269,28 +491,35 @@ class ConnectionExecutor:
         """Return resultset data in Arrow format for frame init."""
         from polars import from_arrow
 
+        if (driver_properties := self._arrow_props) is None:
+            return None
         try:
-            for driver, driver_properties in _ARROW_DRIVER_REGISTRY_.items():
-                if re.match(f"^{driver}$", self.driver_name):
-                    fetch_batches = driver_properties["fetch_batches"]
-                    self.can_close_cursor = fetch_batches is None or not iter_batches
-                    frames = (
-                        from_arrow(batch, schema_overrides=schema_overrides)
-                        for batch in self._fetch_arrow(
-                            driver_properties,
-                            iter_batches=iter_batches,
-                            batch_size=batch_size,
-                        )
-                    )
-                    return frames if iter_batches else next(frames)  # type: ignore[arg-type,return-value]
+            fetch_batches = driver_properties["fetch_batches"]
+            self.can_close_cursor = fetch_batches is None or not iter_batches
+            batches = self._fetch_arrow(
+                driver_properties,
+                iter_batches=iter_batches,
+                batch_size=batch_size,
+            )
+            if iter_batches and fetch_batches is not None:
+                # fetch the next batch while the current one is converted; only
+                # where the driver declares connections can be shared between
+                # threads, as the caller may use the connection between batches
+                if _driver_threadsafety(self.cursor) >= 2:
+                    batches = _prefetch_iter(batches)
+                if batch_size and not driver_properties["exact_batch_size"]:
+                    # backend-sized batches; combine small ones up to batch_size
+                    batches = _coalesce_batches(batches, batch_size)
+            frames = (
+                from_arrow(batch, schema_overrides=schema_overrides)
+                for batch in batches
+            )
+            return frames if iter_batches else next(frames)  # type: ignore[arg-type,return-value]
         except Exception as err:
             # eg: valid turbodbc/snowflake connection, but no arrow support
             # compiled in to the underlying driver (or on this connection)
-            arrow_not_supported = (
-                "does not support Apache Arrow",
-                "Apache Arrow format is not supported",
-            )
-            if not any(e in str(err) for e in arrow_not_supported):
+            errmsg = str(err)
+            if not any(e in errmsg for e in _ARROW_UNSUPPORTED_MESSAGES):
                 raise
 
         return None
@@ -304,44 +533,127 @@ class ConnectionExecutor:
         infer_schema_length: int | None,
     ) -> DataFrame | Iterable[DataFrame] | None:
         """Return resultset data row-wise for frame init."""
-        from polars import DataFrame
-
         if hasattr(self.result, "fetchall"):
             if self.driver_name == "sqlalchemy":
                 if hasattr(self.result, "cursor"):
-                    cursor_desc = {d[0]: d[1:] for d in self.result.cursor.description}
+                    cursor_desc = {d[0]: d for d in self.result.cursor.description}
                 elif hasattr(self.result, "_metadata"):
                     cursor_desc = {k: None for k in self.result._metadata.keys}
                 else:
                     msg = f"Unable to determine metadata from query result; {self.result!r}"
                     raise ValueError(msg)
             else:
-                cursor_desc = {d[0]: d[1:] for d in self.result.description}
+                cursor_desc = {d[0]: d for d in self.result.description}
 
-            schema_overrides = self._inject_type_overrides(
-                description=cursor_desc,
-                schema_overrides=(schema_overrides or {}),
-            )
+            schema_overrides = schema_overrides or {}
+            if not schema_overrides.keys() >= cursor_desc.keys():
+                schema_overrides = self._inject_type_overrides(
+                    description=cursor_desc,
+                    schema_overrides=schema_overrides,
+                )
             result_columns = list(cursor_desc)
-            frames = (
-                DataFrame(
-                    data=rows,
-                    schema=result_columns,
+            if schema_overrides.keys() >= cursor_desc.keys():
+                # every column dtype is already known; no need to infer
+                infer_schema_length = 0
+
+            if iter_batches:
+                # the cursor must outlive this scope; close it (if we own it)
+                # once the caller has finished consuming the batches instead
+                close_cursor, self.can_close_cursor = self.can_close_cursor, False
+                return self._iter_row_frames(
+                    columns=result_columns,
+                    batch_size=batch_size,
                     schema_overrides=schema_overrides,
                     infer_schema_length=infer_schema_length,
-                    orient="row",
-                )
-                for rows in (
-                    list(self._fetchmany_rows(self.result, batch_size))
-                    if iter_batches
-                    else [self._fetchall_rows(self.result)]  # type: ignore[list-item]
+                    close_cursor=close_cursor,
                 )
+            return self._rows_to_frame(
+                rows=self._fetchall_rows(self.result),
+                columns=result_columns,
+                schema_overrides=schema_overrides,
+                infer_schema_length=infer_schema_length,
             )
-            return frames if iter_batches else next(frames)  # type: ignore[arg-type]
         return None
 
-    def _inject_type_overrides(
+    def _iter_row_frames(
         self,
+        *,
+        columns: list[str],
+        batch_size: int | None,
+        schema_overrides: SchemaDict,
+        infer_schema_length: int | None,
+        close_cursor: bool,
+    ) -> Iterable[DataFrame]:
+        """Yield one frame per fetched batch of rows, as the rows are fetched."""
+        try:
+            for rows in self._fetchmany_rows(
+                self.result, batch_size, owned_cursor=close_cursor
+            ):
+                yield self._rows_to_frame(
+                    rows=rows,
+                    columns=columns,
+                    schema_overrides=schema_overrides,
+                    infer_schema_length=infer_schema_length,
+                )
+        finally:
+            if close_cursor and hasattr(self.cursor, "close"):
+                self.cursor.close()
+
+    @staticmethod
+    def _rows_to_frame(
+        rows: Sequence[Sequence[Any]],
+        columns: list[str],
+        schema_overrides: SchemaDict,
+        infer_schema_length: int | None,
+    ) -> DataFrame:
+        """Initialise a frame from a batch of row data."""
+        from polars import DataFrame
+
+        # where every column dtype is already known (from the cursor description
+        # and/or schema_overrides), transpose and load via arrow; the frame dtypes
+        # are then those known dtypes (whatever the number of rows), so we don't
+        # mix arrow and polars inference. falls back to row-wise init if arrow
+        # can't convert a column's values (or pyarrow is not installed), and
+        # if the row width doesn't match the (unique) column names
+        if (
+            rows
+            and _PYARROW_AVAILABLE
+            and len(rows[0]) == len(columns)
+            and all(nm in schema_overrides for nm in columns)
+        ):
+            import pyarrow as pa
+
+            # numeric/boolean/string columns are built directly as the matching
+            # arrow type (no per-value type inference, no cast afterwards); other
+            # known dtypes are cast from arrow's own conversion by `from_arrow`
+            try:
+                arrow_batch = pa.RecordBatch.from_arrays(
+                    [
+                        _to_arrow_array(values, schema_overrides[nm])
+                        for nm, values in zip(columns, zip(*rows))
+                    ],
+                    names=columns,
+                )
+            except (pa.ArrowException, OverflowError, TypeError, ValueError):
+                pass
+            else:
+                return from_arrow(arrow_batch, schema_overrides=schema_overrides)  # type: ignore[return-value]
+
+        # driver-specific row objects (eg: pyodbc/sqlalchemy 'Row') need
+        # to be copied as tuples to be recognised by the row-wise init
+        if rows and not isinstance(rows[0], (list, tuple)):
+            rows = list(map(tuple, rows))
+
+        return DataFrame(
+            data=rows,
+            schema=columns,
+            schema_overrides=schema_overrides,
+            infer_schema_length=infer_schema_length,
+            orient="row",
+        )
+
+    @staticmethod
+    def _inject_type_overrides(
         description: dict[str, Any],
         schema_overrides: SchemaDict,
     ) -> SchemaDict:
@@ -351,12 +663,15 @@ class ConnectionExecutor:
         # currently we only do additional inference from string/python type values.
         # (further refinement requires per-driver module knowledge and lookups).
 
-        dtype: PolarsDataType | None = None
+        # (local refs to the dtype groups checked per column)
+        integer_dtypes = INTEGER_DTYPES
+        unsigned_integer_dtypes = UNSIGNED_INTEGER_DTYPES
         for nm, desc in description.items():
             if desc is None:
                 continue
             elif nm not in schema_overrides:
-                type_code, _disp_size, internal_size, prec, scale, _null_ok = desc
+                _nm, type_code, _disp_size, internal_size, prec, scale, _null_ok = desc
+                dtype: PolarsDataType | None = None
                 if isclass(type_code):
                     # python types, eg: int, float, str, etc
                     with suppress(TypeError):
@@ -374,11 +689,10 @@ class ConnectionExecutor:
                     if dtype == Float64 and internal_size == 4:
                         dtype = Float32
 
-                    elif dtype in INTEGER_DTYPES and internal_size in (2, 4, 8):
-                        bits = internal_size * 8
+                    elif internal_size in (2, 4, 8) and dtype in integer_dtypes:
                         dtype = _integer_dtype_from_nbits(
-                            bits,
-                            unsigned=(dtype in UNSIGNED_INTEGER_DTYPES),
+                            internal_size * 8,
+                            unsigned=(dtype in unsigned_integer_dtypes),
                             default=dtype,
                         )
                     elif (
@@ -403,12 +717,10 @@ class ConnectionExecutor:
                 return conn
             else:
                 # where possible, use the raw connection to access arrow integration
-                if conn.engine.driver == "databricks-sql-python":
-                    self.driver_name = "databricks"
-                    return conn.engine.raw_connection().cursor()
-                elif conn.engine.driver == "duckdb_engine":
-                    self.driver_name = "duckdb"
-                    return conn.engine.raw_connection().driver_connection.c
+                engine = conn.engine
+                if raw_cursor := _SQLALCHEMY_RAW_CURSORS.get(engine.driver):
+                    self.driver_name, get_cursor = raw_cursor
+                    return get_cursor(engine.raw_connection())
                 elif conn_type == "Engine":
                     return conn.connect()
                 else:
@@ -436,20 +748,16 @@ class ConnectionExecutor:
     ) -> Self:
         """Execute a query and reference the result set."""
         if select_queries_only and isinstance(query, str):
-            q = re.search(r"\w{3,}", re.sub(r"/\*(.|[\r\n])*?\*/", "", query))
-            if (query_type := "" if not q else q.group(0)) in _INVALID_QUERY_TYPES:
-                msg = f"{query_type} statements are not valid 'read' queries"
-                raise UnsuitableSQLError(msg)
+            _check_read_query(query)
 
         options = options or {}
         cursor_execute = self.cursor.execute
 
         if self.driver_name == "sqlalchemy":
-            from sqlalchemy.orm import Session
-
+            sqla = _sqlalchemy()
             param_key = "parameters"
             if (
-                isinstance(self.cursor, Session)
+                isinstance(self.cursor, sqla.Session)
                 and "parameters" in options
                 and "params" not in options
             ):
@@ -468,27 +776,21 @@ class ConnectionExecutor:
                     ):
                         options[param_key] = tuple(params)
                 else:
-                    from sqlalchemy.sql import text
-
-                    query = text(query)  # type: ignore[assignment]
+                    query = sqla.text(query)
 
         # note: some cursor execute methods (eg: sqlite3) only take positional
         # params, hence the slightly convoluted resolution of the 'options' dict
-        try:
-            params = signature(cursor_execute).parameters
-        except ValueError:
-            params = {}
-
-        if not options or any(
-            p.kind in (Parameter.KEYWORD_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
-            for p in params.values()
-        ):
-            result = cursor_execute(query, **options)
+        if not options:
+            result = cursor_execute(query)
         else:
-            positional_options = (
-                options[o] for o in (params or options) if (not options or o in options)
-            )
-            result = cursor_execute(query, *positional_options)
+            params, accepts_keywords = _execute_parameters(self.cursor, cursor_execute)
+            if accepts_keywords:
+                result = cursor_execute(query, **options)
+            else:
+                positional_options = (
+                    options[o] for o in (params or options) if o in options
+                )
+                result = cursor_execute(query, *positional_options)
 
         # note: some cursors execute in-place
         result = self.cursor if result is None else result
@@ -647,6 +949,16 @@ def read_database(  # noqa: D417
       query then that cursor will be automatically closed when the query completes;
       however, polars will *never* close any other open connection or cursor.
 
+    * If you pass a SQLAlchemy `Engine`, each call checks out a connection from
+      the engine's own connection pool; for most drivers this is returned to the
+      pool when the query completes, so repeated reads reuse existing connections.
+      Pool behaviour is configured on the engine itself (see the `pool_size` and
+      `poolclass` parameters of `create_engine`); an engine created with a `NullPool`
+      will open a new connection for every query. Note that engines using the
+      `duckdb_engine` or `databricks-sql-python` drivers are read via a raw driver
+      connection (to load Arrow data directly), which is only released back to the
+      pool when it is garbage-collected.
+
     * We are able to support more than just relational databases and SQL queries
       through this function. For example, we can load graph database results from
       a `KùzuDB` connection in conjunction with a Cypher query.
@@ -705,7 +1017,7 @@ def read_database(  # noqa: D417
     """  # noqa: W505
     if isinstance(connection, str):
         # check for odbc connection string
-        if re.search(r"\bdriver\s*=\s*{[^}]+?}", connection, re.IGNORECASE):
+        if "driver" in connection.lower() and _RE_ODBC_DRIVER.search(connection):
             try:
                 import arrow_odbc  # noqa: F401
             except ModuleNotFoundError:
@@ -754,6 +1066,115 @@ def read_database(  # noqa: D417
         )
 
 
+async def read_database_async(
+    query: str,
+    connection: Any,
+    *,
+    schema_overrides: SchemaDict | None = None,
+    infer_schema_length: int | None = N_INFER_DEFAULT,
+    execute_options: dict[str, Any] | None = None,
+) -> DataFrame:
+    """
+    Read the results of a SQL query into a DataFrame, awaiting the result.
+
+    Allows many queries to be in flight concurrently from a single event loop.
+
+    Parameters
+    ----------
+    query
+        SQL query to execute.
+    connection
+        An `asyncpg` connection (or pool), which is queried natively, or any
+        connection object supported by :func:`read_database`; these are queried on
+        a worker thread (using the running event loop's default executor).
+    schema_overrides
+        A dictionary mapping column names to dtypes, used to override the schema
+        inferred from the query cursor or given by the incoming Arrow data (depending
+        on driver/backend).
+    infer_schema_length
+        The maximum number of rows to scan for schema inference. If set to `None`, the
+        full data may be scanned *(this is slow)*.
+    execute_options
+        These options will be passed through into the underlying query execution method
+        as kwargs; for `asyncpg` connections, only a "parameters" sequence is accepted,
+        supplying the values for positional (`$1`, `$2`, ...) query placeholders.
+
+    Notes
+    -----
+    * Connections that are not natively asynchronous are used from a thread other
+      than the one that created them, so must allow this (for example, `sqlite3`
+      connections must be opened with `check_same_thread=False`).
+
+    See Also
+    --------
+    read_database : Create a DataFrame from a SQL query using a connection object.
+
+    Examples
+    --------
+    Run several queries concurrently against an `asyncpg` pool:
+
+    >>> import asyncio
+    >>> async def load_all(pool):
+    ...     return await asyncio.gather(
+    ...         pl.read_database_async("SELECT * FROM test_data", pool),
+    ...         pl.read_database_async("SELECT * FROM test_meta", pool),
+    ...     )
+    >>> df_data, df_meta = asyncio.run(load_all(asyncpg_pool))  # doctest: +SKIP
+    """
+    if type(connection).__module__.split(".", 1)[0] == "asyncpg":
+        _check_read_query(query)
+
+        options = execute_options or {}
+        if unsupported_options := sorted(options.keys() - {"parameters"}):
+            msg = f"`execute_options` for asyncpg connections only support 'parameters'; found {unsupported_options!r}"
+            raise ValueError(msg)
+
+        params = options.get("parameters") or ()
+        if hasattr(connection, "acquire"):
+            # connection pool; run the query on a pooled connection (statement
+            # attributes must be read before the connection is released)
+            async with connection.acquire() as conn:
+                rows, attributes = await _asyncpg_fetch(conn, query, params)
+        else:
+            rows, attributes = await _asyncpg_fetch(connection, query, params)
+
+        description = {
+            attr.name: (attr.name, attr.type.name, None, None, None, None, None)
+            for attr in attributes
+        }
+        return ConnectionExecutor._rows_to_frame(
+            rows=rows,
+            columns=list(description),
+            schema_overrides=ConnectionExecutor._inject_type_overrides(
+                description=description,
+                schema_overrides=dict(schema_overrides or {}),
+            ),
+            infer_schema_length=infer_schema_length,
+        )
+
+    from asyncio import get_running_loop
+
+    return await get_running_loop().run_in_executor(
+        None,
+        partial(
+            read_database,
+            query,
+            connection,
+            schema_overrides=schema_overrides,
+            infer_schema_length=infer_schema_length,
+            execute_options=execute_options,
+        ),
+    )
+
+
+async def _asyncpg_fetch(
+    connection: Any, query: str, params: Sequence[Any]
+) -> tuple[list[Any], tuple[Any, ...]]:
+    """Run a query on an asyncpg connection, returning rows and column attributes."""
+    stmt = await connection.prepare(query)
+    return await stmt.fetch(*params), stmt.get_attributes()
+
+
 def read_database_uri(
     query: list[str] | str,
     uri: str,
@@ -821,7 +1242,11 @@ def read_database_uri(
     is available `here <https://sfu-db.github.io/connector-x/intro.html>`_.
 
     For `adbc` you will need to have installed `pyarrow` and the ADBC driver associated
-    with the backend you are connecting to, eg: `adbc-driver-postgresql`.
+    with the backend you are connecting to, eg: `adbc-driver-postgresql`. Note that
+    each call opens (and closes) a new ADBC connection; if you are issuing many
+    queries against the same database, open the connection once and pass it to
+    :func:`read_database` instead (which will reuse it, and still load Arrow data
+    directly).
 
     If your password contains special characters, you will need to escape them.
     This will usually require the use of a URL-escaping function, for example:
@@ -878,35 +1303,62 @@ def read_database_uri(
     if not isinstance(uri, str):
         msg = f"expected connection to be a URI string; found {type(uri).__name__!r}"
         raise TypeError(msg)
-    elif engine is None:
-        engine = "connectorx"
 
-    if engine == "connectorx":
-        if execute_options:
-            msg = "the 'connectorx' engine does not support use of `execute_options`"
-            raise ValueError(msg)
-        return _read_sql_connectorx(
-            query,
-            connection_uri=uri,
-            partition_on=partition_on,
-            partition_range=partition_range,
-            partition_num=partition_num,
-            protocol=protocol,
-            schema_overrides=schema_overrides,
-        )
-    elif engine == "adbc":
-        if not isinstance(query, str):
-            msg = "only a single SQL query string is accepted for adbc"
-            raise ValueError(msg)
-        return _read_sql_adbc(
-            query,
-            connection_uri=uri,
-            schema_overrides=schema_overrides,
-            execute_options=execute_options,
-        )
-    else:
+    try:
+        read_sql = _READ_SQL_ENGINES["connectorx" if engine is None else engine]
+    except KeyError:
         msg = f"engine must be one of {{'connectorx', 'adbc'}}, got {engine!r}"
+        raise ValueError(msg) from None
+
+    return read_sql(
+        query,
+        uri,
+        partition_on=partition_on,
+        partition_range=partition_range,
+        partition_num=partition_num,
+        protocol=protocol,
+        schema_overrides=schema_overrides,
+        execute_options=execute_options,
+    )
+
+
+def _dispatch_connectorx(
+    query: str | list[str],
+    uri: str,
+    *,
+    execute_options: dict[str, Any] | None,
+    **kwargs: Any,
+) -> DataFrame:
+    if execute_options:
+        msg = "the 'connectorx' engine does not support use of `execute_options`"
         raise ValueError(msg)
+    return _read_sql_connectorx(query, connection_uri=uri, **kwargs)
+
+
+def _dispatch_adbc(
+    query: str | list[str],
+    uri: str,
+    *,
+    schema_overrides: SchemaDict | None,
+    execute_options: dict[str, Any] | None,
+    **kwargs: Any,
+) -> DataFrame:
+    if not isinstance(query, str):
+        msg = "only a single SQL query string is accepted for adbc"
+        raise ValueError(msg)  # noqa: TRY004
+    return _read_sql_adbc(
+        query,
+        connection_uri=uri,
+        schema_overrides=schema_overrides,
+        execute_options=execute_options,
+    )
+
+
+# read_database_uri engine name -> reader (each validating its own options)
+_READ_SQL_ENGINES: dict[str, Callable[..., DataFrame]] = {
+    "connectorx": _dispatch_connectorx,
+    "adbc": _dispatch_adbc,
+}
 
 
 def _read_sql_connectorx(
@@ -936,12 +1388,28 @@ def _read_sql_connectorx(
         )
     except BaseException as err:
         # basic sanitisation of /user:pass/ credentials exposed in connectorx errs
-        errmsg = re.sub("://[^:]+:[^:]+@", "://***:***@", str(err))
+        errmsg = _mask_credentials(str(err))
         raise type(err)(errmsg) from err
 
     return from_arrow(tbl, schema_overrides=schema_overrides)  # type: ignore[return-value]
 
 
+def _mask_credentials(s: str) -> str:
+    """Mask any "://user:pass@" credentials found in the given string."""
+    start = 0
+    while (scheme_end := s.find("://", start)) != -1:
+        start = scheme_end + 3
+        user_end = s.find(":", start)
+        if user_end > start:
+            # the password runs up to the last '@' before the next ':'
+            pass_end = s.find(":", user_end + 1)
+            at = s.rfind("@", user_end + 2, len(s) if pass_end == -1 else pass_end)
+            if at != -1:
+                s = f"{s[:scheme_end]}{_MASKED_URI_CREDENTIALS}{s[at + 1:]}"
+                start = scheme_end + len(_MASKED_URI_CREDENTIALS)
+    return s
+
+
 def _read_sql_adbc(
     query: str,
     connection_uri: str,
@@ -957,24 +1425,22 @@ def _read_sql_adbc(
 def _open_adbc_connection(connection_uri: str) -> Any:
     driver_name = connection_uri.split(":", 1)[0].lower()
 
-    # map uri prefix to module when not 1:1
-    module_suffix_map: dict[str, str] = {
-        "postgres": "postgresql",
-    }
-    try:
-        module_suffix = module_suffix_map.get(driver_name, driver_name)
-        module_name = f"adbc_driver_{module_suffix}.dbapi"
-        import_module(module_name)
-        adbc_driver = sys.modules[module_name]
-    except ImportError:
-        msg = (
-            f"ADBC {driver_name} driver not detected"
-            f"\n\nIf ADBC supports this database, please run: pip install adbc-driver-{driver_name} pyarrow"
-        )
-        raise ModuleNotFoundError(msg) from None
+    # note: imported driver modules are cached by driver name (never by the
+    # full connection URI, which may contain credentials)
+    if (adbc_driver := _ADBC_DRIVER_MODULES.get(driver_name)) is None:
+        try:
+            module_suffix = _ADBC_MODULE_SUFFIXES.get(driver_name, driver_name)
+            adbc_driver = import_module(f"adbc_driver_{module_suffix}.dbapi")
+        except ImportError:
+            msg = (
+                f"ADBC {driver_name} driver not detected"
+                f"\n\nIf ADBC supports this database, please run: pip install adbc-driver-{driver_name} pyarrow"
+            )
+            raise ModuleNotFoundError(msg) from None
+        _ADBC_DRIVER_MODULES[driver_name] = adbc_driver
 
     # some backends require the driver name to be stripped from the URI
-    if driver_name in ("sqlite", "snowflake"):
-        connection_uri = re.sub(f"^{driver_name}:/{{,3}}", "", connection_uri)
+    if (driver_prefix := _RE_ADBC_DRIVER_PREFIX.get(driver_name)) is not None:
+        connection_uri = driver_prefix.sub("", connection_uri)
 
     return adbc_driver.connect(connection_uri)
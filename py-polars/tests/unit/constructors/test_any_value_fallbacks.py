@@ -185,7 +185,6 @@ def test_fallback_with_dtype_nonstrict(
     result = wrap_s(
         PySeries.new_from_any_values_and_dtype("", values, dtype, strict=False)
     )
-    print(result.to_list())
     assert result.to_list() == expected
 
 
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import sqlite3
 import sys
-from contextlib import suppress
+import threading
+from contextlib import asynccontextmanager, suppress
 from datetime import date
 from pathlib import Path
-from types import GeneratorType
-from typing import TYPE_CHECKING, Any, NamedTuple
+from types import GeneratorType, ModuleType, SimpleNamespace
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator, NamedTuple
 
 import pyarrow as pa
 import pytest
@@ -17,8 +19,12 @@ from sqlalchemy.sql.expression import cast as alchemy_cast
 
 import polars as pl
 from polars.datatypes.convert import _infer_dtype_from_database_typename
-from polars.exceptions import ComputeError, UnsuitableSQLError
-from polars.io.database import _ARROW_DRIVER_REGISTRY_
+from polars.exceptions import ComputeError, ShapeError, UnsuitableSQLError
+from polars.io.database import (
+    _ARROW_DRIVER_REGISTRY_,
+    _coalesce_batches,
+    _prefetch_iter,
+)
 from polars.testing import assert_frame_equal
 
 if TYPE_CHECKING:
@@ -190,6 +196,63 @@ class MockResultSet:
         return res
 
 
+class MockAsyncpgConnection:
+    """Mock asyncpg connection (statements are unusable once it is released)."""
+
+    __module__ = "asyncpg.connection"
+
+    def __init__(self, rows: list[tuple[Any, ...]], columns: dict[str, str]) -> None:
+        self.rows = rows
+        self.attributes = tuple(
+            SimpleNamespace(name=name, type=SimpleNamespace(name=typename))
+            for name, typename in columns.items()
+        )
+        self.released = False
+        self.fetch_args: tuple[Any, ...] = ()
+
+    def _check_released(self) -> None:
+        if self.released:
+            msg = "underlying connection has been released back to the pool"
+            raise RuntimeError(msg)
+
+    async def prepare(self, query: str) -> Any:
+        self._check_released()
+        return MockAsyncpgStatement(self)
+
+
+class MockAsyncpgStatement:
+    """Mock asyncpg prepared statement."""
+
+    def __init__(self, conn: MockAsyncpgConnection) -> None:
+        self.conn = conn
+
+    async def fetch(self, *args: Any) -> list[tuple[Any, ...]]:
+        self.conn._check_released()
+        self.conn.fetch_args = args
+        return self.conn.rows
+
+    def get_attributes(self) -> tuple[Any, ...]:
+        self.conn._check_released()
+        return self.conn.attributes
+
+
+class MockAsyncpgPool:
+    """Mock asyncpg connection pool."""
+
+    __module__ = "asyncpg.pool"
+
+    def __init__(self, conn: MockAsyncpgConnection) -> None:
+        self.conn = conn
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[MockAsyncpgConnection]:
+        self.conn.released = False
+        try:
+            yield self.conn
+        finally:
+            self.conn.released = True
+
+
 @pytest.mark.write_disk()
 @pytest.mark.parametrize(
     (
@@ -447,6 +510,139 @@ def test_read_database_parameterised(tmp_sqlite_db: Path) -> None:
             )
 
 
+def test_read_database_iter_batches_rows(tmp_sqlite_db: Path) -> None:
+    # row-wise drivers should fetch (and yield) one batch at a time
+    conn = sqlite3.connect(tmp_sqlite_db)
+    batches = pl.read_database(
+        "SELECT id, name FROM test_data ORDER BY id",
+        connection=conn,
+        iter_batches=True,
+        batch_size=1,
+    )
+    assert isinstance(batches, GeneratorType)
+    assert_frame_equal(
+        pl.concat(batches),
+        pl.DataFrame({"id": [1, 2], "name": ["misc", "other"]}),
+    )
+    conn.close()
+
+
+def test_read_database_user_cursor_arraysize(tmp_sqlite_db: Path) -> None:
+    # the state of user-supplied cursors (eg: 'arraysize') is left untouched
+    cursor = sqlite3.connect(tmp_sqlite_db).cursor()
+    arraysize = cursor.arraysize
+
+    df = pl.read_database("SELECT id FROM test_data", connection=cursor)
+    assert df.height == 2
+    assert cursor.arraysize == arraysize
+
+    batches = pl.read_database(
+        "SELECT id FROM test_data",
+        connection=cursor,
+        iter_batches=True,
+        batch_size=arraysize + 1,
+    )
+    assert pl.concat(batches).height == 2
+    assert cursor.arraysize == arraysize
+    cursor.connection.close()
+
+
+def test_read_database_duplicate_column_names(tmp_sqlite_db: Path) -> None:
+    # duplicate names can't be loaded as distinct columns; the row width
+    # must not silently be truncated to the number of unique names
+    conn = sqlite3.connect(tmp_sqlite_db)
+    for schema_overrides in (None, {"id": pl.Int64, "name": pl.String}):
+        with pytest.raises(ShapeError, match="does not match the number of columns"):
+            pl.read_database(
+                "SELECT id, id, name FROM test_data",
+                connection=conn,
+                schema_overrides=schema_overrides,
+            )
+    conn.close()
+
+
+def test_read_database_known_dtypes_arrow_load(
+    tmp_sqlite_db: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # where every column dtype is known, rows are loaded via typed arrow
+    # arrays (independent of `infer_schema_length`)
+    from polars.io import database
+
+    arrow_loads: list[pa.Schema] = []
+
+    def from_arrow(data: Any, **kwargs: Any) -> Any:
+        arrow_loads.append(data.schema)
+        return pl.from_arrow(data, **kwargs)
+
+    monkeypatch.setattr(database, "from_arrow", from_arrow)
+
+    conn = sqlite3.connect(tmp_sqlite_db)
+    schema_overrides = {"id": pl.Int32, "name": pl.String, "value": pl.Float32}
+    df = pl.read_database(
+        "SELECT id, name, value FROM test_data ORDER BY id",
+        connection=conn,
+        schema_overrides=schema_overrides,
+        infer_schema_length=1,
+    )
+    assert df.schema == schema_overrides
+    assert df.rows() == [(1, "misc", 100.0), (2, "other", -99.5)]
+    assert arrow_loads == [
+        pa.schema({"id": pa.int32(), "name": pa.large_string(), "value": pa.float32()})
+    ]
+    conn.close()
+
+
+def test_read_database_async(tmp_sqlite_db: Path) -> None:
+    # non-async connections are queried concurrently on worker threads
+    conn = sqlite3.connect(tmp_sqlite_db, check_same_thread=False)
+
+    async def read_all() -> list[pl.DataFrame]:
+        return await asyncio.gather(
+            *(
+                pl.read_database_async(
+                    f"SELECT name FROM test_data WHERE id = {n}", connection=conn
+                )
+                for n in (1, 2)
+            )
+        )
+
+    df1, df2 = asyncio.run(read_all())
+    assert_frame_equal(df1, pl.DataFrame({"name": ["misc"]}))
+    assert_frame_equal(df2, pl.DataFrame({"name": ["other"]}))
+    conn.close()
+
+
+def test_read_database_async_asyncpg() -> None:
+    # asyncpg connections (and pools) are queried natively
+    expected = pl.DataFrame({"id": [1, 2], "name": ["misc", "other"]})
+    conn = MockAsyncpgConnection(
+        rows=[(1, "misc"), (2, "other")],
+        columns={"id": "bigint", "name": "text"},
+    )
+    for connection in (conn, MockAsyncpgPool(conn)):
+        df = asyncio.run(
+            pl.read_database_async(
+                "SELECT id, name FROM test_data WHERE id > $1",
+                connection=connection,
+                execute_options={"parameters": [0]},
+            )
+        )
+        assert_frame_equal(df, expected)
+        assert conn.fetch_args == (0,)
+
+    with pytest.raises(UnsuitableSQLError, match="DROP statements are not valid"):
+        asyncio.run(pl.read_database_async("DROP TABLE test_data", connection=conn))
+
+    with pytest.raises(ValueError, match="only support 'parameters'.*'timeout'"):
+        asyncio.run(
+            pl.read_database_async(
+                "SELECT id, name FROM test_data",
+                connection=conn,
+                execute_options={"timeout": 10},
+            )
+        )
+
+
 @pytest.mark.parametrize(
     ("param", "param_value"),
     [
@@ -545,6 +741,154 @@ def test_read_database_mocked(
     assert res.rows() == [(1, "aa"), (2, "bb"), (3, "cc")]
 
 
+@pytest.mark.parametrize(
+    ("threadsafety", "prefetch"), [(0, False), (1, False), (2, True)]
+)
+def test_read_database_mocked_prefetch(
+    threadsafety: int, prefetch: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # arrow batches are only prefetched on a background thread if the driver
+    # declares (DBAPI2 'threadsafety') that connections can be shared by threads
+    from polars.io import database
+
+    prefetch_calls = []
+
+    def prefetch_iter(source: Any, ahead: int = 1) -> Iterator[Any]:
+        prefetch_calls.append(source)
+        return _prefetch_iter(source, ahead)
+
+    monkeypatch.setattr(database, "_prefetch_iter", prefetch_iter)
+
+    driver_module = ModuleType("mock_dbapi_driver")
+    driver_module.threadsafety = threadsafety  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "mock_dbapi_driver", driver_module)
+    monkeypatch.setattr(MockCursor, "__module__", "mock_dbapi_driver.cursor")
+
+    arrow = pl.DataFrame({"x": [1, 2, 3], "y": ["aa", "bb", "cc"]}).to_arrow()
+    mc = MockConnection("snowflake", 2, test_data=arrow, repeat_batch_calls=False)
+    res = pl.read_database(
+        query="SELECT * FROM test_data",
+        connection=mc,
+        iter_batches=True,
+        batch_size=2,
+    )
+    assert pl.concat(res).rows() == [(1, "aa"), (2, "bb"), (3, "cc")]
+    assert bool(prefetch_calls) is prefetch
+
+
+def test_read_database_mocked_arrow_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    # generic DBAPI2 errors (not indicating a lack of arrow support)
+    # must be raised, not treated as a cue to fall back to row data
+    class NotSupportedError(Exception):
+        pass
+
+    def fetch_arrow(*args: Any, **kwargs: Any) -> Any:
+        msg = "unsupported result type: INTERVAL"
+        raise NotSupportedError(msg)
+
+    arrow = pl.DataFrame({"x": [1, 2, 3]}).to_arrow()
+    mc = MockConnection("snowflake", None, test_data=arrow, repeat_batch_calls=False)
+    monkeypatch.setattr(mc.cursor(), "resultset", fetch_arrow)
+
+    with pytest.raises(NotSupportedError, match="unsupported result type"):
+        pl.read_database("SELECT * FROM test_data", connection=mc)
+
+
+@pytest.mark.parametrize(
+    ("driver", "expected_heights"),
+    [
+        # backend-sized batches are combined up to (at least) batch_size rows
+        ("snowflake", [2, 2, 1]),
+        # drivers that respect the requested batch size are not coalesced
+        ("databricks", [1, 1, 1, 1, 1]),
+    ],
+)
+def test_read_database_mocked_batch_coalescing(
+    driver: str, expected_heights: list[int], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    arrow = pl.DataFrame({"x": [1, 2, 3, 4, 5], "y": ["a", "b", "c", "d", "e"]})
+    arrow_batches = arrow.to_arrow().to_batches(max_chunksize=1)
+    repeat_batch_calls = _ARROW_DRIVER_REGISTRY_[driver]["repeat_batch_calls"]
+
+    def fetch_batches(*args: Any, **kwargs: Any) -> Any:
+        # the backend returns one-row batches, whatever size is requested
+        if repeat_batch_calls:
+            return arrow_batches.pop(0) if arrow_batches else None
+        return iter(arrow_batches)
+
+    mc = MockConnection(
+        driver, 2, test_data=arrow.to_arrow(), repeat_batch_calls=repeat_batch_calls
+    )
+    monkeypatch.setattr(mc.cursor(), "resultset", fetch_batches)
+
+    frames = list(
+        pl.read_database(
+            query="SELECT * FROM test_data",
+            connection=mc,
+            iter_batches=True,
+            batch_size=2,
+        )
+    )
+    assert [df.height for df in frames] == expected_heights
+    assert_frame_equal(pl.concat(frames), arrow)
+
+
+def test_coalesce_batches() -> None:
+    batches = pa.table({"x": [1, 2, 3, 4, 5]}).to_batches(max_chunksize=1)
+
+    # small batches are grouped; the trailing partial group holds the remainder
+    groups = list(_coalesce_batches(batches, batch_size=2))
+    assert [len(g) if isinstance(g, list) else 1 for g in groups] == [2, 2, 1]
+    assert isinstance(groups[-1], pa.RecordBatch)
+    assert groups[-1].num_rows == 1
+
+    # a batch that already meets batch_size is passed through as-is (not a list)
+    big_batch = pa.RecordBatch.from_pydict({"x": [1, 2, 3]})
+    (group,) = _coalesce_batches([big_batch], batch_size=2)
+    assert group is big_batch
+    assert list(_coalesce_batches([], batch_size=2)) == []
+
+
+def _prefetch_threads() -> list[threading.Thread]:
+    return [t for t in threading.enumerate() if t.name == "polars-db-prefetch"]
+
+
+def test_prefetch_iter() -> None:
+    assert list(_prefetch_iter(range(5))) == [0, 1, 2, 3, 4]
+    assert not _prefetch_threads()
+
+    # exceptions raised by the source are handed over to the consumer
+    def failing_source() -> Iterator[int]:
+        yield 1
+        msg = "fetch failed"
+        raise ValueError(msg)
+
+    batches = _prefetch_iter(failing_source())
+    assert next(batches) == 1
+    with pytest.raises(ValueError, match="fetch failed"):
+        next(batches)
+    assert not _prefetch_threads()
+
+    # closing the iterator early stops (and joins) the producer thread,
+    # which stays no more than a couple of items ahead of the consumer
+    n_fetched = 0
+
+    def source() -> Iterator[int]:
+        nonlocal n_fetched
+        for n in range(1000):
+            n_fetched += 1
+            yield n
+
+    batches = _prefetch_iter(source())
+    assert isinstance(batches, GeneratorType)
+    for n in batches:
+        if n == 2:
+            break
+    batches.close()
+    assert not _prefetch_threads()
+    assert n_fetched <= 5
+
+
 @pytest.mark.parametrize(
     (
         "read_method",
@@ -641,6 +985,16 @@ def test_read_database_mocked(
             ),
             id="Invalid statement type",
         ),
+        pytest.param(
+            *ExceptionTestParams(
+                read_method="read_database",
+                query="/* multi\nline */\n  drop table xyz",
+                protocol=sqlite3.connect(":memory:"),
+                errclass=UnsuitableSQLError,
+                errmsg="DROP statements are not valid 'read' queries",
+            ),
+            id="Invalid statement type",
+        ),
         pytest.param(
             *ExceptionTestParams(
                 read_method="read_database",
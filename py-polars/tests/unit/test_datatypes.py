@@ -16,6 +16,7 @@ from polars.datatypes import (
     List,
     Struct,
     py_type_to_dtype,
+    unpack_dtypes,
 )
 
 if TYPE_CHECKING:
@@ -143,6 +144,33 @@ def test_repr(dtype: pl.PolarsDataType, representation: str) -> None:
     assert repr(dtype) == representation
 
 
+def test_repr_to_dtype_mapping() -> None:
+    # ensure the static short repr table stays in sync with the Rust dtype reprs
+    from polars.datatypes.convert import _REPR_TO_DTYPE, dtype_short_repr_to_dtype
+    from polars.polars import dtype_str_repr
+
+    for short_repr, dtype in _REPR_TO_DTYPE.items():
+        assert dtype_str_repr(dtype).split("[")[0] == short_repr
+        assert dtype_short_repr_to_dtype(short_repr) is dtype
+
+
+def test_unpack_dtypes() -> None:
+    schema: dict[str, pl.PolarsDataType] = {
+        "a": pl.List(pl.Int64),
+        "b": pl.String,
+        "c": pl.Struct({"x": pl.Float64, "y": pl.List(pl.Int64)}),
+    }
+    expected = {pl.Int64, pl.String, pl.Float64}
+    for dtypes in (list(schema.values()), tuple(schema.values()), schema.values()):
+        assert unpack_dtypes(dtypes) == expected  # type: ignore[arg-type]
+    assert unpack_dtypes(*schema.values()) == expected
+    assert unpack_dtypes(schema.values(), include_compound=True) == expected | {  # type: ignore[arg-type]
+        schema["a"],
+        schema["c"],
+        pl.List(pl.Int64),
+    }
+
+
 def test_conversion_dtype() -> None:
     df = (
         pl.DataFrame(